@@ -1,23 +1,221 @@
 #!/usr/bin/env python3
 
 import os
-import glob
 import re
+import copy
+import mmap
+import struct
+import hashlib
+import functools
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Pool
+from io import BytesIO
 from pathlib import Path
 from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.util import Inches
 from PIL import Image
 import time
 
+# Embedded images are resampled down to this many pixels per inch of their
+# on-slide size; anything larger only inflates the file
+TARGET_DPI = 150
+
+_EMU_PER_INCH = int(Inches(1))
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff')
+
+_NUM_RE = re.compile(r'([0-9]+)')
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+# JPEG start-of-frame markers; C4, C8 and CC share the range but are not frames
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+@functools.lru_cache(maxsize=None)
 def natural_sort_key(filename):
     """
     Generate a key for natural sorting of filenames with numbers.
     This ensures '2.png' comes before '10.png'
     """
-    def convert(text):
-        return int(text) if text.isdigit() else text.lower()
+    return tuple(int(c) if c.isdigit() else c.lower() for c in _NUM_RE.split(filename))
+
+def _fast_size(image_data):
+    """
+    Read the (width, height) of a PNG or JPEG straight from its header.
+    
+    Args:
+        image_data (bytes or mmap): Raw image file contents
+    
+    Returns:
+        tuple: (width, height), or None if the format is not recognised
+    """
+    if image_data[:8] == _PNG_SIGNATURE and image_data[12:16] == b'IHDR':
+        return struct.unpack('>II', image_data[16:24])
+    
+    if image_data[:2] == b'\xff\xd8':
+        pos = 2
+        while pos + 9 <= len(image_data):
+            if image_data[pos] != 0xFF:
+                return None
+            marker = image_data[pos + 1]
+            if marker == 0xFF:
+                # Fill byte before the actual marker
+                pos += 1
+                continue
+            if marker in _JPEG_SOF_MARKERS:
+                height, width = struct.unpack('>HH', image_data[pos + 5:pos + 9])
+                return width, height
+            if marker == 0x01 or 0xD0 <= marker <= 0xD7:
+                # Standalone markers carry no length field
+                pos += 2
+                continue
+            segment_length = struct.unpack('>H', image_data[pos + 2:pos + 4])[0]
+            pos += 2 + segment_length
+    
+    return None
+
+def _load_image(image_file):
+    """
+    Memory-map an image file, hash it and probe its size.
+    
+    The hash and size are computed over the mapping, so the file is never
+    copied into a Python bytes object here; duplicates and images that get
+    downscaled are never copied at all.
+    
+    Args:
+        image_file (str or os.PathLike): Path to the image file
+    
+    Returns:
+        tuple: (open mmap of the file, SHA-1 digest of its bytes, (width, height)).
+        The caller is responsible for closing the mmap.
+    """
+    with open(image_file, 'rb') as f:
+        image_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            size = _fast_size(image_map)
+            if size is None:
+                # Other formats are rare enough to leave to PIL, which only
+                # needs to read the header from the open file
+                with Image.open(f) as img:
+                    size = img.size
+            return image_map, hashlib.sha1(image_map).digest(), size
+        except Exception:
+            image_map.close()
+            raise
+
+def _prefetch(func, items, window):
+    """
+    Run func over items on a thread pool, keeping at most `window` calls in flight.
+    
+    Yields (item, future) pairs in order. Calling future.result() re-raises any
+    error from func, so callers can handle failures per item.
+    """
+    with ThreadPoolExecutor(max_workers=window) as executor:
+        items = iter(items)
+        pending = deque((item, executor.submit(func, item)) for item in itertools.islice(items, window))
+        while pending:
+            item, future = pending.popleft()
+            for next_item in itertools.islice(items, 1):
+                pending.append((next_item, executor.submit(func, next_item)))
+            yield item, future
+
+def _downscale_image(image_stream, max_size, stretch=False):
+    """
+    Resample an image so it fits within max_size and re-encode it.
+    
+    Args:
+        image_stream: Seekable file-like object holding the original image
+        max_size (tuple): Maximum (width, height) in pixels
+        stretch (bool): Cap each axis separately instead of keeping the aspect
+            ratio, for pictures that are stretched to a different shape anyway
+    
+    Returns:
+        A BytesIO holding the re-encoded image, or the original stream if
+        the image cannot be resampled without losing content (animations)
+    """
+    image_stream.seek(0)
+    with Image.open(image_stream) as img:
+        if getattr(img, 'is_animated', False):
+            return image_stream
+        if stretch:
+            max_width, max_height = max_size
+            img = img.resize((min(img.width, max_width), min(img.height, max_height)), Image.LANCZOS)
+        else:
+            img.thumbnail(max_size, Image.LANCZOS)
+        
+        output = BytesIO()
+        # Carry the color profile over, or wide-gamut photos shift color
+        icc_profile = img.info.get('icc_profile')
+        if img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info):
+            # Keep transparency by staying lossless
+            img.save(output, format='PNG', optimize=True, icc_profile=icc_profile)
+        else:
+            # A CMYK or gray profile doesn't describe the converted RGB pixels
+            if img.mode != 'RGB':
+                icc_profile = None
+            img.convert('RGB').save(output, format='JPEG', quality=85, optimize=True, icc_profile=icc_profile)
+    return output
+
+@functools.lru_cache(maxsize=None)
+def _fit_box(img_width, img_height, slide_width, slide_height, fit_mode):
+    """
+    Compute where an image goes on a slide for the given fit mode.
+    
+    Results are cached: folders usually hold many images of the same size
+    (e.g. from one camera), so each distinct size is only computed once.
+    
+    Args:
+        img_width, img_height (int): Image size in pixels
+        slide_width, slide_height (int): Slide size in EMU
+        fit_mode (str): "contain", "cover" or "stretch"
+    
+    Returns:
+        tuple: (left, top, width, height) in EMU
+    """
+    if fit_mode == "stretch":
+        # Stretch to fill slide (may distort image)
+        return 0, 0, slide_width, slide_height
+    
+    # "cover" is "contain" with the wide/tall decision inverted. Sizes are
+    # integer EMUs, so cross-multiply instead of using float ratios
+    if (img_width * slide_height > slide_width * img_height) != (fit_mode == "cover"):
+        # Contain a wider image or cover a taller one: scale by width
+        width = slide_width
+        height = slide_width * img_height // img_width
+    else:
+        # Contain a taller image or cover a wider one: scale by height
+        height = slide_height
+        width = slide_height * img_width // img_height
+    
+    # Center on the slide; this is 0 along any dimension that fills it
+    return (slide_width - width) // 2, (slide_height - height) // 2, width, height
+
+def _clone_picture(slide, picture, left, top, width, height, descr):
+    """
+    Add a copy of an existing picture shape to a slide, reusing its image part.
     
-    return [convert(c) for c in re.split('([0-9]+)', filename)]
+    This skips add_picture's image parsing and part lookup, which only repeat
+    work already done when the same image was first added.
+    
+    Args:
+        slide: Slide to add the picture to
+        picture: Picture shape already showing the image (on any slide)
+        left, top, width, height (int): Position and size in EMU
+        descr (str): Alt text for the copy, normally the image's filename
+    """
+    image_part = picture.part.related_part(picture._element.blip_rId)
+    rId = slide.part.relate_to(image_part, RT.IMAGE)
+    
+    pic = copy.deepcopy(picture._element)
+    shape_id = slide.shapes._next_shape_id
+    pic.nvPicPr.cNvPr.id = shape_id
+    pic.nvPicPr.cNvPr.name = f"Picture {shape_id - 1}"
+    pic.nvPicPr.cNvPr.set('descr', descr)
+    pic.blipFill.blip.rEmbed = rId
+    pic.x, pic.y, pic.cx, pic.cy = left, top, width, height
+    slide.shapes._spTree.insert_element_before(pic, 'p:extLst')
 
 def show_progress(current, total, prefix='', suffix='', length=50, fill='█'):
     """
@@ -38,7 +236,7 @@ def show_progress(current, total, prefix='', suffix='', length=50, fill='█'):
     if current == total:
         print()
 
-def create_presentation_from_images(images_folder="images", output_file="presentation.pptx", slide_format="4:3", fit_mode="contain"):
+def create_presentation_from_images(images_folder="images", output_file="presentation.pptx", slide_format="4:3", fit_mode="contain", verbose=False, progress=True):
     """
     Create a PowerPoint presentation from images in a folder.
     
@@ -50,127 +248,205 @@ def create_presentation_from_images(images_folder="images", output_file="present
             - "cover": Image covers entire slide (may crop)
             - "contain": Entire image fits within slide (may have margins)
             - "stretch": Image stretches to fill slide (may distort)
+        verbose (bool): Print the processing order and where each image was placed
+        progress (bool): Show a progress bar while slides are created
+    
+    Returns:
+        bool: True if the presentation was saved, False otherwise
     """
     start_time = time.time()
     
+    if fit_mode not in ("contain", "cover", "stretch"):
+        print(f"Unknown fit mode '{fit_mode}'. Use 'contain', 'cover' or 'stretch'.")
+        return False
+    
     # Create a new presentation with the specified aspect ratio
     if slide_format == "4:3":
         prs = Presentation()  # Default is 4:3
         # Explicitly set to 4:3 dimensions (10" x 7.5")
         prs.slide_width = Inches(10)
         prs.slide_height = Inches(7.5)
-        print(f"Creating presentation with 4:3 format ({prs.slide_width/Inches(1)}\" x {prs.slide_height/Inches(1)}\")")
+        print(f"Creating presentation with 4:3 format ({prs.slide_width/_EMU_PER_INCH}\" x {prs.slide_height/_EMU_PER_INCH}\")")
     else:  # 16:9
         prs = Presentation()
         # Set to 16:9 dimensions (13.33" x 7.5")
         prs.slide_width = Inches(13.33)
         prs.slide_height = Inches(7.5)
-        print(f"Creating presentation with 16:9 format ({prs.slide_width/Inches(1)}\" x {prs.slide_height/Inches(1)}\")")
-    
-    image_extensions = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.bmp', '*.tiff']
-    image_files = []
+        print(f"Creating presentation with 16:9 format ({prs.slide_width/_EMU_PER_INCH}\" x {prs.slide_height/_EMU_PER_INCH}\")")
     
     print("\nScanning for images...")
-    for extension in image_extensions:
-        image_files.extend(glob.glob(os.path.join(images_folder, extension)))
-        image_files.extend(glob.glob(os.path.join(images_folder, extension.upper())))
-    
-    image_files.sort(key=lambda x: natural_sort_key(os.path.basename(x)))
+    # A single directory pass with a case-insensitive extension match; this
+    # also avoids listing a file twice on case-insensitive filesystems
+    try:
+        with os.scandir(images_folder) as entries:
+            # Keep the DirEntry objects: entry.name is the basename for free
+            image_entries = sorted(
+                (entry for entry in entries
+                 if entry.name.lower().endswith(IMAGE_EXTENSIONS) and entry.is_file()),
+                key=lambda entry: natural_sort_key(entry.name)
+            )
+    except OSError:
+        # Missing folder, or a path that isn't a folder
+        image_entries = []
     
-    if not image_files:
+    if not image_entries:
         print(f"No image files found in {images_folder} folder.")
-        return
+        return False
     
-    total_images = len(image_files)
+    total_images = len(image_entries)
     print(f"\nFound {total_images} image(s). Creating presentation in {slide_format} format with '{fit_mode}' fitting...")
-    print("\nProcessing order:")
-    for i, img_file in enumerate(image_files):
-        print(f"  {i+1}. {os.path.basename(img_file)}")
+    if verbose:
+        order = [f"  {i+1}. {entry.name}" for i, entry in enumerate(image_entries)]
+        print("\nProcessing order:\n" + "\n".join(order))
     print()
     
+    # The first picture added for each distinct image, keyed by content hash;
+    # byte-identical images on later slides are cloned from it
+    hash_to_picture = {}
+    
+    # These don't change between slides, so look them up once
+    slide_layout = prs.slide_layouts[6]  # Blank layout
+    slide_width = prs.slide_width
+    slide_height = prs.slide_height
+    # Per-slide details are collected and written once after the loop
+    slide_log = []
+    
+    # Images are read ahead of the slide loop on a thread pool; this is I/O
+    # bound, so the reads overlap while only a bounded window sits in memory
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    loaded_images = _prefetch(_load_image, image_entries, max_workers)
+    
     print("Creating slides...")
-    for i, image_file in enumerate(image_files):
-        show_progress(i + 1, total_images, prefix='Progress:', suffix=f'Slide {i+1}/{total_images}')
+    last_progress = 0.0
+    for i, (entry, loaded) in enumerate(loaded_images):
+        # Redrawing the bar for every slide costs more than the slide itself,
+        # so redraw at most every 0.1s and always on the last slide
+        now = time.monotonic()
+        if progress and (now - last_progress >= 0.1 or i == total_images - 1):
+            show_progress(i + 1, total_images, prefix='Progress:', suffix=f'Slide {i+1}/{total_images}')
+            last_progress = now
         
-        slide_layout = prs.slide_layouts[6]  # Blank layout
         slide = prs.slides.add_slide(slide_layout)
         
-        slide_width = prs.slide_width
-        slide_height = prs.slide_height
-        
         try:
-            with Image.open(image_file) as img:
-                img_width, img_height = img.size
-            
-            # Calculate aspect ratios
-            slide_ratio = slide_width / slide_height
-            img_ratio = img_width / img_height
+            image_map, digest, (img_width, img_height) = loaded.result()
             
-            if fit_mode == "contain":
-                # Fit entire image within slide (no cropping)
-                if img_ratio > slide_ratio:
-                    # Image is wider, scale by width
-                    scale_factor = slide_width / img_width
-                    final_width = slide_width
-                    final_height = int(img_height * scale_factor)
-                    left = 0
-                    top = (slide_height - final_height) // 2
-                else:
-                    # Image is taller, scale by height
-                    scale_factor = slide_height / img_height
-                    final_height = slide_height
-                    final_width = int(img_width * scale_factor)
-                    left = (slide_width - final_width) // 2
-                    top = 0
+            left, top, final_width, final_height = _fit_box(
+                img_width, img_height, slide_width, slide_height, fit_mode
+            )
             
-            elif fit_mode == "cover":
-                # Cover entire slide (may crop image)
-                if img_ratio > slide_ratio:
-                    # Image is wider, scale by height
-                    scale_factor = slide_height / img_height
-                    final_height = slide_height
-                    final_width = int(img_width * scale_factor)
-                    left = (slide_width - final_width) // 2
-                    top = 0
+            with image_map:
+                picture = hash_to_picture.get(digest)
+                if picture is not None:
+                    _clone_picture(slide, picture, left, top, final_width, final_height, entry.name)
                 else:
-                    # Image is taller, scale by width
-                    scale_factor = slide_width / img_width
-                    final_width = slide_width
-                    final_height = int(img_height * scale_factor)
-                    left = 0
-                    top = (slide_height - final_height) // 2
-            
-            elif fit_mode == "stretch":
-                # Stretch to fill slide (may distort image)
-                final_width = slide_width
-                final_height = slide_height
-                left = 0
-                top = 0
+                    # add_picture and PIL both read straight from the mapping
+                    image_stream = image_map
+                    # At least one pixel, even for slivers under 1/TARGET_DPI inch
+                    max_width = max(1, final_width * TARGET_DPI // _EMU_PER_INCH)
+                    max_height = max(1, final_height * TARGET_DPI // _EMU_PER_INCH)
+                    if img_width > max_width or img_height > max_height:
+                        image_stream = _downscale_image(
+                            image_map, (max_width, max_height), stretch=(fit_mode == "stretch")
+                        )
+                    
+                    picture = slide.shapes.add_picture(
+                        image_stream,
+                        left=left,
+                        top=top,
+                        width=final_width,
+                        height=final_height
+                    )
+                    # add_picture takes the alt text from the file name, which a
+                    # stream doesn't have; keep the image's own name instead
+                    picture._element.nvPicPr.cNvPr.set('descr', entry.name)
+                    hash_to_picture[digest] = picture
             
-            picture = slide.shapes.add_picture(
-                image_file,
-                left=left,
-                top=top,
-                width=final_width,
-                height=final_height
-            )
+            if verbose:
+                slide_log.append(
+                    f"  Slide {i+1}: {entry.name} ({img_width}x{img_height}px) "
+                    f"-> {final_width/_EMU_PER_INCH:.2f}\" x {final_height/_EMU_PER_INCH:.2f}\" "
+                    f"at ({left/_EMU_PER_INCH:.2f}\", {top/_EMU_PER_INCH:.2f}\")"
+                )
             
         except Exception as e:
-            print(f"\nError adding image {image_file}: {str(e)}")
+            print(f"\nError adding image {entry.path}: {str(e)}")
             continue
     
+    if slide_log:
+        print("\nSlide details:\n" + "\n".join(slide_log))
+    
     print("\nSaving presentation...")
     try:
-        prs.save(output_file)
+        # Write through a 1 MiB buffer so the many small ZIP writes are
+        # combined into fewer, larger ones
+        with open(output_file, 'wb', buffering=1 << 20) as f:
+            prs.save(f)
         end_time = time.time()
         duration = end_time - start_time
         
         print(f"\nPresentation saved successfully as '{output_file}'")
-        print(f"Created {len(prs.slides)} slides from {len(image_files)} images in {slide_format} format")
+        print(f"Created {len(prs.slides)} slides from {total_images} images in {slide_format} format")
         print(f"Images fitted using '{fit_mode}' mode")
         print(f"Total processing time: {duration:.1f} seconds")
+        return True
     except Exception as e:
         print(f"\nError saving presentation: {str(e)}")
+        return False
+
+def _build_one(job):
+    """Build a single presentation for build_many; returns (output_file, success)."""
+    images_folder, output_file, slide_format, fit_mode = job
+    try:
+        # Progress bars from parallel workers would overwrite each other
+        return output_file, create_presentation_from_images(
+            images_folder, output_file, slide_format, fit_mode, progress=False
+        )
+    except Exception as e:
+        # An error escaping a worker would abort the whole batch
+        print(f"\nError creating {output_file} from {images_folder}: {str(e)}")
+        return output_file, False
+
+def build_many(folders, output_dir=".", slide_format="4:3", fit_mode="contain", workers=None):
+    """
+    Create one presentation per image folder, building them in parallel.
+    
+    Each folder becomes '<output_dir>/<folder name>.pptx'; folders sharing a
+    name get a numeric suffix ('images_2.pptx', ...). Folders are handled
+    by separate worker processes, so image decoding and saving run in parallel
+    rather than being serialized by the GIL.
+    
+    Args:
+        folders (list): Paths of the image folders
+        output_dir (str): Folder to write the presentations to
+        slide_format (str): Slide format, either "4:3" or "16:9"
+        fit_mode (str): How to fit images on slides ("contain", "cover" or "stretch")
+        workers (int, optional): Number of worker processes. Defaults to the CPU count
+    
+    Returns:
+        list: Paths of the presentations that were created successfully
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = []
+    used_names = set()
+    for folder in folders:
+        # Parallel workers must never write the same output file; names are
+        # compared case-insensitively for case-insensitive filesystems
+        base_name = name = Path(folder).resolve().name
+        suffix = 1
+        while name.lower() in used_names:
+            suffix += 1
+            name = f"{base_name}_{suffix}"
+        used_names.add(name.lower())
+        jobs.append((folder, os.path.join(output_dir, f"{name}.pptx"), slide_format, fit_mode))
+    
+    created = []
+    # A fresh process per presentation keeps python-pptx memory from piling up
+    with Pool(processes=workers, maxtasksperchild=1) as pool:
+        for output_file, success in pool.imap_unordered(_build_one, jobs):
+            if success:
+                created.append(output_file)
+    return created
 
 def main():
     """Main function to run the script"""
@@ -2,7 +2,7 @@
 
 import sys
 from create_presentation import create_presentation_from_images
-from ppt_converter import convert_pptx_to_pdf, find_libreoffice_executable
+from ppt_converter import convert_pptx_to_pdf, convert_many, find_libreoffice_executable
 from ui_manager import create_slides_menu, convert_pdf_menu, main_menu
 
 def check_libreoffice():
@@ -27,7 +27,7 @@ def main():
             create_slides_menu(create_presentation_from_images)
         
         def convert_pdf():
-            convert_pdf_menu(convert_pptx_to_pdf)
+            convert_pdf_menu(convert_pptx_to_pdf, convert_many)
         
         # Start the main menu
         main_menu(create_slides, convert_pdf)
@@ -5,10 +5,39 @@ import sys
 import subprocess
 import platform
 import shutil
-from PyPDF2 import PdfReader, PdfWriter
+import json
+import importlib.util
+import functools
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+import pikepdf
+from pikepdf import Name, PdfImage
+from PIL import Image
 
+# Image compression settings for each PDF quality level. PDFs smaller than
+# min_size_mb are left as they are, since recompressing them saves next to nothing
+COMPRESSION_PARAMS = {
+    'low': {'image_quality': 30, 'image_resolution': 72, 'min_size_mb': 0.5},
+    'medium': {'image_quality': 60, 'image_resolution': 150, 'min_size_mb': 2.0},
+    'high': {'image_quality': 80, 'image_resolution': 300, 'min_size_mb': 5.0}
+}
+
+# Streams recompressed by downsize_pdf use the highest Flate level. This is a
+# process-wide pikepdf setting with no getter to restore it from, so it is set
+# once here rather than changed around each save
+pikepdf.settings.set_flate_compression_level(9)
+
+# Gray images with more distinct levels than this are treated as photos
+LINE_ART_GRAY_LEVELS = 16
+
+# Converters can write multi-megabyte logs to stderr; only the tail is shown
+MAX_ERROR_OUTPUT = 64 * 1024
+
+@functools.lru_cache(maxsize=None)
 def install_package(package_name):
-    """Install a Python package using pip if not already installed."""
+    """Install a Python package using pip if not already installed. The result is cached per package."""
     try:
         __import__(package_name.replace('-', '_'))
         return True
@@ -22,6 +51,114 @@ def install_package(package_name):
             print(f"pip install {package_name}")
             return False
 
+# Whether the pure Python conversion dependencies are available; None until checked
+_deps_ready = None
+
+def _ensure_deps():
+    """
+    Make sure reportlab and python-pptx are available, installing them if needed.
+    
+    The check runs at most once per process; later calls return the cached
+    result, whether it succeeded or not.
+    
+    Returns:
+        bool: True if both packages can be imported, False otherwise
+    """
+    global _deps_ready
+    if _deps_ready is None:
+        if importlib.util.find_spec("reportlab") and importlib.util.find_spec("pptx"):
+            _deps_ready = True
+        else:
+            _deps_ready = install_package("reportlab") and install_package("python-pptx")
+    return _deps_ready
+
+def _is_line_art(pil_image):
+    """
+    Guess whether an image is line art or flat color rather than a photo.
+    
+    Color images count as line art when they use at most 256 colors. Any
+    8-bit grayscale image fits in 256 levels, so gray images (including
+    gray stored as RGB) must use at most LINE_ART_GRAY_LEVELS of them.
+    
+    Args:
+        pil_image (PIL.Image.Image): Decoded image
+    
+    Returns:
+        bool: True if the image should stay lossless
+    """
+    colors = pil_image.getcolors(256)
+    if colors is None:
+        return False
+    
+    if pil_image.mode == 'L':
+        gray = True
+    elif pil_image.mode == 'RGB':
+        gray = all(r == g == b for _, (r, g, b) in colors)
+    else:
+        gray = False
+    return not gray or len(colors) <= LINE_ART_GRAY_LEVELS
+
+def _recompress_image(image, image_quality, max_size):
+    """
+    Re-encode an embedded PDF image as JPEG if that makes it smaller.
+    
+    JPEGs are always re-encoded. Losslessly stored images are only converted
+    when they look photographic; line art and other flat-color images stay
+    lossless, where Flate beats JPEG and avoids artifacts.
+    
+    Args:
+        image (pikepdf.Stream): Image XObject to rewrite in place
+        image_quality (int): JPEG quality (1-95)
+        max_size (tuple): (width, height) in pixels that fill the page at the
+            target resolution; larger photos are downsampled to fit
+    
+    Returns:
+        bool: True if the image was replaced, False if it was left as is
+    """
+    # Stencil masks and images with a custom Decode array don't survive
+    # a round trip through PIL unchanged
+    if image.get('/ImageMask', False) or '/Decode' in image:
+        return False
+    
+    try:
+        pdf_image = PdfImage(image)
+        if pdf_image.bits_per_component < 8:
+            return False
+        pil_image = pdf_image.as_pil_image()
+    except Exception:
+        # Colorspaces or filters PIL can't handle are left untouched
+        return False
+    
+    if '/DCTDecode' not in pdf_image.filters and _is_line_art(pil_image):
+        return False
+    
+    if pil_image.mode != 'L':
+        pil_image = pil_image.convert('RGB')
+    
+    # An image can't be shown larger than its page, so pixels beyond the target
+    # resolution at page size are wasted. Keep the axis that needs more pixels
+    # at or above the target
+    scale = min(1.0, max(max_size[0] / pil_image.width, max_size[1] / pil_image.height))
+    if scale < 1.0:
+        new_size = (max(1, round(pil_image.width * scale)), max(1, round(pil_image.height * scale)))
+        pil_image = pil_image.resize(new_size, Image.LANCZOS)
+    
+    buffer = BytesIO()
+    # optimize adds a second Huffman pass, progressive entropy-codes better
+    # and 4:2:0 halves the chroma resolution
+    pil_image.save(
+        buffer, 'JPEG', quality=image_quality, optimize=True, progressive=True, subsampling='4:2:0'
+    )
+    if buffer.tell() >= len(image.read_raw_bytes()):
+        return False
+    
+    image.write(buffer.getvalue(), filter=Name.DCTDecode)
+    image.ColorSpace = Name.DeviceGray if pil_image.mode == 'L' else Name.DeviceRGB
+    image.BitsPerComponent = 8
+    image.Width = pil_image.width
+    image.Height = pil_image.height
+    return True
+
 def downsize_pdf(input_file, output_file=None, quality='medium'):
     """
     Downsize a PDF file by compressing images and optimizing content.
@@ -41,26 +178,70 @@ def downsize_pdf(input_file, output_file=None, quality='medium'):
         # Get original file size
         original_size = os.path.getsize(input_file) / (1024 * 1024)  # Size in MB
         
-        # Create PDF reader and writer
-        reader = PdfReader(input_file)
-        writer = PdfWriter()
-        
         # Set compression parameters based on quality
-        compression_params = {
-            'low': {'image_quality': 30, 'image_resolution': 72},
-            'medium': {'image_quality': 60, 'image_resolution': 150},
-            'high': {'image_quality': 80, 'image_resolution': 300}
-        }
+        params = COMPRESSION_PARAMS.get(quality, COMPRESSION_PARAMS['medium'])
         
-        params = compression_params.get(quality, compression_params['medium'])
+        # Skip the full parse and rewrite for PDFs that are already small
+        if original_size < params['min_size_mb']:
+            print(f"PDF is already small ({original_size:.2f} MB), skipping compression.")
+            if os.path.abspath(output_file) != os.path.abspath(input_file):
+                shutil.copyfile(input_file, output_file)
+            return True
         
-        # Process each page
-        for page in reader.pages:
-            writer.add_page(page)
+        # Downsample embedded images to the requested resolution and
+        # re-encode them as JPEG at the requested quality
+        with pikepdf.open(input_file) as pdf:
+            processed = set()
+            recompressed = 0
+            for page in pdf.pages:
+                # Pixel size of a page-filling image at the target resolution
+                left, bottom, right, top = (float(value) for value in page.mediabox)
+                max_size = (
+                    abs(right - left) / 72 * params['image_resolution'],
+                    abs(top - bottom) / 72 * params['image_resolution']
+                )
+                # Page.images is deprecated in newer pikepdf in favour of get_images()
+                images = page.get_images() if hasattr(page, 'get_images') else page.images
+                for image in images.values():
+                    # Images shared between pages only need rewriting once
+                    if image.objgen in processed:
+                        continue
+                    processed.add(image.objgen)
+                    if _recompress_image(image, params['image_quality'], max_size):
+                        recompressed += 1
+            
+            # Write the compressed PDF to a temporary file beside the output and
+            # swap it in afterwards. This lets the output overwrite the input
+            # while pikepdf keeps reading the input lazily from disk, instead of
+            # loading the whole file into memory as allow_overwriting_input would
+            fd, temp_file = tempfile.mkstemp(suffix=".pdf", dir=os.path.dirname(os.path.abspath(output_file)))
+            os.close(fd)
+            # Lossless streams, including the line art kept above, are
+            # recompressed at the Flate level set at import. The file is also
+            # linearized so viewers can show the first page before the rest
+            # has downloaded
+            try:
+                pdf.save(
+                    temp_file,
+                    object_stream_mode=pikepdf.ObjectStreamMode.generate,
+                    compress_streams=True,
+                    stream_decode_level=pikepdf.StreamDecodeLevel.generalized,
+                    recompress_flate=True,
+                    linearize=True
+                )
+            except Exception:
+                os.remove(temp_file)
+                raise
         
-        # Write the compressed PDF
-        with open(output_file, 'wb') as output:
-            writer.write(output)
+        # mkstemp creates the file readable by its owner only; give it the
+        # permissions the output already has, or those of a new file
+        if os.path.exists(output_file):
+            shutil.copymode(output_file, temp_file)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(temp_file, 0o666 & ~umask)
+        os.replace(temp_file, output_file)
         
         # Get new file size
         new_size = os.path.getsize(output_file) / (1024 * 1024)  # Size in MB
@@ -69,6 +250,7 @@ def downsize_pdf(input_file, output_file=None, quality='medium'):
         compression_ratio = (1 - (new_size / original_size)) * 100
         
         print(f"\nPDF compression results:")
+        print(f"Images recompressed: {recompressed}")
         print(f"Original size: {original_size:.2f} MB")
         print(f"New size: {new_size:.2f} MB")
         print(f"Compression ratio: {compression_ratio:.1f}%")
@@ -85,7 +267,7 @@ def convert_pptx_to_pdf_python(input_file, output_file):
         print("Trying pure Python conversion method...")
         
         # Try python-pptx and reportlab
-        if install_package("reportlab") and install_package("python-pptx"):
+        if _ensure_deps():
             from pptx import Presentation
             from reportlab.lib.pagesizes import letter
             from reportlab.pdfgen import canvas
@@ -102,7 +284,9 @@ def convert_pptx_to_pdf_python(input_file, output_file):
             c = canvas.Canvas(output_file, pagesize=letter)
             width, height = letter
             
-            for i, slide in enumerate(prs.slides):
+            # Placeholders only need the slide count; read it once
+            slide_count = len(prs.slides)
+            for i in range(slide_count):
                 print(f"Processing slide {i+1}...")
                 
                 # This is a simplified approach - we're creating a blank PDF with placeholders
@@ -112,7 +296,7 @@ def convert_pptx_to_pdf_python(input_file, output_file):
                 c.drawString(100, height - 200, "For best results, install LibreOffice")
                 
                 # Move to next page
-                if i < len(prs.slides) - 1:
+                if i < slide_count - 1:
                     c.showPage()
             
             c.save()
@@ -150,8 +334,14 @@ def convert_pptx_to_pdf_python(input_file, output_file):
         print(f"Pure Python conversion failed: {str(e)}")
         return False
 
+@functools.lru_cache(maxsize=1)
 def find_libreoffice_executable():
-    """Find the LibreOffice executable on the system."""
+    """
+    Find the LibreOffice executable on the system.
+    
+    The search stats several paths and walks PATH twice, so the result is
+    cached; the found paths are only printed on the first call.
+    """
     system = platform.system()
     
     # Dictionary to store found paths for debugging
@@ -214,10 +404,46 @@ def find_libreoffice_executable():
     print("No LibreOffice executable found on the system.")
     return None
 
-def convert_pptx_to_pdf_libreoffice(input_file, output_file):
-    """Convert PPTX to PDF using LibreOffice."""
+def _libreoffice_pdf_filter(quality='medium'):
+    """
+    Build the LibreOffice --convert-to argument for a PDF quality level.
+    
+    The PDF export filter downsamples and JPEG-compresses images itself, so
+    the exported file needs no separate downsize_pdf pass.
+    
+    Args:
+        quality (str): PDF quality level ('low', 'medium', 'high')
+    
+    Returns:
+        str: Value for the --convert-to option
+    """
+    params = COMPRESSION_PARAMS.get(quality, COMPRESSION_PARAMS['medium'])
+    options = {
+        "ReduceImageResolution": {"type": "boolean", "value": "true"},
+        "MaxImageResolution": {"type": "long", "value": str(params['image_resolution'])},
+        "UseLosslessCompression": {"type": "boolean", "value": "false"},
+        "Quality": {"type": "long", "value": str(params['image_quality'])},
+        "ExportBookmarks": {"type": "boolean", "value": "false"}
+    }
+    return "pdf:impress_pdf_Export:" + json.dumps(options, separators=(',', ':'))
+
+def convert_pptx_to_pdf_libreoffice(input_file, output_file, quality='medium', user_profile=None):
+    """
+    Convert PPTX to PDF using LibreOffice, compressing images during export.
+    
+    Args:
+        input_file (str): Path to the input PPTX file
+        output_file (str): Path to the output PDF file
+        quality (str): PDF quality level ('low', 'medium', 'high')
+        user_profile (str, optional): Directory for a private LibreOffice user profile.
+            LibreOffice allows one running instance per profile, so conversions
+            that run at the same time each need their own
+    
+    Returns:
+        bool: True if conversion was successful, False otherwise
+    """
+    outdir = None
     try:
-        system = platform.system()
         print("Trying LibreOffice conversion method...")
         
         # Find LibreOffice executable
@@ -228,45 +454,46 @@ def convert_pptx_to_pdf_libreoffice(input_file, output_file):
             return False
         
         print(f"Using LibreOffice executable: {libreoffice_cmd}")
+        convert_to = _libreoffice_pdf_filter(quality)
+        profile_args = [f"-env:UserInstallation={Path(user_profile).as_uri()}"] if user_profile else []
         
-        # Prepare the command
-        if system == "Windows":
-            cmd = f'"{libreoffice_cmd}" --headless --convert-to pdf --outdir "." "{input_file}"'
-            print(f"Running command: {cmd}")
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        else:
-            cmd = [libreoffice_cmd, "--headless", "--convert-to", "pdf", "--outdir", ".", input_file]
-            print(f"Running command: {' '.join(cmd)}")
-            result = subprocess.run(cmd, capture_output=True, text=True)
+        # LibreOffice names the PDF after the input, so export into a private
+        # directory beside the output and move it into place from there. Using
+        # the output's directory directly would overwrite an unrelated
+        # <stem>.pdf there whenever the output has a different name
+        outdir = tempfile.mkdtemp(prefix="lo_export_", dir=os.path.dirname(output_file) or ".")
+        exported = os.path.join(outdir, Path(input_file).stem + ".pdf")
+        
+        # Run LibreOffice directly from an argument list on every platform; going
+        # through cmd.exe on Windows adds a process and breaks on quoting
+        cmd = [libreoffice_cmd, *profile_args, "--headless", "--convert-to", convert_to, "--outdir", outdir, input_file]
+        print(f"Running command: {' '.join(cmd)}")
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
         
         # Check if the command was successful
         if result.returncode == 0:
             print(f"LibreOffice conversion successful!")
-            print(f"Command output: {result.stdout}")
+            os.replace(exported, output_file)
             return True
         else:
             print(f"LibreOffice conversion failed with return code: {result.returncode}")
-            print(f"Error output: {result.stderr}")
+            print(f"Error output: {result.stderr[-MAX_ERROR_OUTPUT:]}")
             
             # Try with soffice if libreoffice failed
             if "libreoffice" in libreoffice_cmd and shutil.which("soffice"):
                 print("Trying with 'soffice' command instead...")
                 soffice_cmd = shutil.which("soffice")
                 
-                if system == "Windows":
-                    cmd = f'"{soffice_cmd}" --headless --convert-to pdf --outdir "." "{input_file}"'
-                    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-                else:
-                    cmd = [soffice_cmd, "--headless", "--convert-to", "pdf", "--outdir", ".", input_file]
-                    result = subprocess.run(cmd, capture_output=True, text=True)
+                cmd = [soffice_cmd, *profile_args, "--headless", "--convert-to", convert_to, "--outdir", outdir, input_file]
+                result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
                 
                 if result.returncode == 0:
                     print(f"Soffice conversion successful!")
-                    print(f"Command output: {result.stdout}")
+                    os.replace(exported, output_file)
                     return True
                 else:
                     print(f"Soffice conversion failed with return code: {result.returncode}")
-                    print(f"Error output: {result.stderr}")
+                    print(f"Error output: {result.stderr[-MAX_ERROR_OUTPUT:]}")
             
             return False
     
@@ -275,6 +502,10 @@ def convert_pptx_to_pdf_libreoffice(input_file, output_file):
         import traceback
         traceback.print_exc()
         return False
+    
+    finally:
+        if outdir:
+            shutil.rmtree(outdir, ignore_errors=True)
 
 def convert_pptx_to_pdf_platform_specific(input_file, output_file):
     """Convert PPTX to PDF using platform-specific methods."""
@@ -287,15 +518,15 @@ def convert_pptx_to_pdf_platform_specific(input_file, output_file):
             unoconv_path = shutil.which("unoconv")
             if unoconv_path:
                 print(f"Found unoconv at: {unoconv_path}")
-                result = subprocess.run(["unoconv", "-f", "pdf", input_file], 
-                                       capture_output=True, text=True)
+                result = subprocess.run(["unoconv", "-f", "pdf", "-o", output_file, input_file], 
+                                       stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
                 
                 if result.returncode == 0:
                     print(f"Unoconv conversion successful!")
                     return True
                 else:
                     print(f"Unoconv failed with return code: {result.returncode}")
-                    print(f"Error output: {result.stderr}")
+                    print(f"Error output: {result.stderr[-MAX_ERROR_OUTPUT:]}")
             else:
                 print("Unoconv not found on the system.")
         except Exception as e:
@@ -308,8 +539,8 @@ def convert_pptx_to_pdf_platform_specific(input_file, output_file):
             import win32com.client
             powerpoint = win32com.client.Dispatch("PowerPoint.Application")
             powerpoint.Visible = True
-            deck = powerpoint.Presentations.Open(os.path.abspath(input_file))
-            deck.SaveAs(os.path.abspath(output_file), 32)  # 32 is the PDF format code
+            deck = powerpoint.Presentations.Open(input_file)
+            deck.SaveAs(output_file, 32)  # 32 is the PDF format code
             deck.Close()
             powerpoint.Quit()
             print(f"PowerPoint automation conversion successful!")
@@ -321,32 +552,35 @@ def convert_pptx_to_pdf_platform_specific(input_file, output_file):
     if system == "Darwin":  # Darwin = macOS
         try:
             print("Trying macOS-specific conversion method...")
-            # Use Automator or AppleScript to convert
+            # Use AppleScript to convert. Poll for the opened document (for up
+            # to 10s) instead of sleeping a fixed time; export is synchronous
             script = f'''
-            tell application "Keynote" 
-                open "{os.path.abspath(input_file)}"
-                delay 2
-                export front document as PDF to "{os.path.abspath(output_file)}"
-                delay 2
+            tell application "Keynote"
+                open POSIX file "{input_file}"
+                repeat 100 times
+                    if (count of documents) > 0 then exit repeat
+                    delay 0.1
+                end repeat
+                export front document as PDF to POSIX file "{output_file}"
                 close front document saving no
                 quit
             end tell
             '''
             result = subprocess.run(["osascript", "-e", script], 
-                                   capture_output=True, text=True)
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
             
             if result.returncode == 0:
                 print(f"macOS Keynote conversion successful!")
                 return True
             else:
                 print(f"macOS Keynote conversion failed with return code: {result.returncode}")
-                print(f"Error output: {result.stderr}")
+                print(f"Error output: {result.stderr[-MAX_ERROR_OUTPUT:]}")
         except Exception as e:
             print(f"macOS conversion failed: {str(e)}")
     
     return False
 
-def convert_pptx_to_pdf(input_file, output_file=None, quality='medium'):
+def convert_pptx_to_pdf(input_file, output_file=None, quality='medium', skip_libreoffice=False):
     """
     Convert a PowerPoint presentation to PDF using available methods.
     
@@ -354,6 +588,8 @@ def convert_pptx_to_pdf(input_file, output_file=None, quality='medium'):
         input_file (str): Path to the input PPTX file
         output_file (str, optional): Path to the output PDF file. If None, uses the same name as input with .pdf extension.
         quality (str): PDF quality level ('low', 'medium', 'high')
+        skip_libreoffice (bool): Don't try LibreOffice, e.g. because it already
+            failed on this file
     
     Returns:
         bool: True if conversion was successful, False otherwise
@@ -361,6 +597,12 @@ def convert_pptx_to_pdf(input_file, output_file=None, quality='medium'):
     if not output_file:
         output_file = input_file.rsplit(".", 1)[0] + ".pdf"
     
+    # Resolve both paths once; every backend gets absolute paths, which
+    # PowerPoint and Keynote require and which keep LibreOffice's output out
+    # of the current working directory
+    input_file = os.path.abspath(input_file)
+    output_file = os.path.abspath(output_file)
+    
     print(f"Converting {input_file} to {output_file}...")
     system = platform.system()
     
@@ -377,11 +619,16 @@ def convert_pptx_to_pdf(input_file, output_file=None, quality='medium'):
         convert_pptx_to_pdf_platform_specific,
         convert_pptx_to_pdf_python  # Python method as last resort
     ]
+    if skip_libreoffice:
+        methods.remove(convert_pptx_to_pdf_libreoffice)
     
     success = False
     for method in methods:
         print(f"\nAttempting conversion with {method.__name__}...")
-        if method(input_file, output_file):
+        # LibreOffice compresses images while exporting, so it takes the quality level
+        fused = method is convert_pptx_to_pdf_libreoffice
+        args = (input_file, output_file, quality) if fused else (input_file, output_file)
+        if method(*args):
             print(f"\nConversion successful! PDF saved as {output_file}")
             success = True
             break
@@ -398,6 +645,10 @@ def convert_pptx_to_pdf(input_file, output_file=None, quality='medium'):
         print("- Python packages: pip install reportlab python-pptx")
         return False
     
+    if fused:
+        print("Images were compressed by LibreOffice during export.")
+        return True
+    
     # After successful conversion, downsize the PDF
     print("\nOptimizing PDF file size...")
     if downsize_pdf(output_file, quality=quality):
@@ -405,4 +656,50 @@ def convert_pptx_to_pdf(input_file, output_file=None, quality='medium'):
     else:
         print("PDF optimization failed, but the original PDF was created successfully.")
     
-    return True 
\ No newline at end of file
+    return True 
+
+def convert_many(input_files, quality='medium'):
+    """
+    Convert several PowerPoint presentations to PDF in parallel.
+    
+    Each file is converted by its own LibreOffice process with a private user
+    profile, since LibreOffice otherwise allows only one instance at a time.
+    Files LibreOffice can't convert fall back to the other methods of
+    convert_pptx_to_pdf one by one.
+    
+    Args:
+        input_files (list): Paths to the input PPTX files
+        quality (str): PDF quality level ('low', 'medium', 'high')
+    
+    Returns:
+        dict: Maps each input file to True if it was converted, False otherwise
+    """
+    results = {}
+    
+    if input_files and find_libreoffice_executable():
+        profile_root = tempfile.mkdtemp(prefix="lo_profiles_")
+        try:
+            max_workers = min(os.cpu_count() or 1, len(input_files))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    input_file: executor.submit(
+                        convert_pptx_to_pdf_libreoffice,
+                        os.path.abspath(input_file),
+                        os.path.abspath(input_file.rsplit(".", 1)[0] + ".pdf"),
+                        quality,
+                        user_profile=os.path.join(profile_root, str(i))
+                    )
+                    for i, input_file in enumerate(input_files)
+                }
+            results = {input_file: future.result() for input_file, future in futures.items()}
+        finally:
+            shutil.rmtree(profile_root, ignore_errors=True)
+    
+    for input_file in input_files:
+        if not results.get(input_file):
+            # Don't run LibreOffice again on files it was already given
+            results[input_file] = convert_pptx_to_pdf(
+                input_file, quality=quality, skip_libreoffice=input_file in results
+            )
+    
+    return results
@@ -2,11 +2,18 @@
 
 import os
 import sys
-import glob
+# Share the builder's list so the menu counts exactly the images it picks up
+from create_presentation import IMAGE_EXTENSIONS
+
+if os.name == 'nt':
+    # Running an empty command once turns on ANSI escape handling in the
+    # Windows 10+ console, which clear_screen relies on
+    os.system('')
 
 def clear_screen():
-    """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    """Clear the terminal screen with ANSI escapes instead of spawning cls/clear."""
+    sys.stdout.write('\x1b[2J\x1b[H')
+    sys.stdout.flush()
 
 def print_header():
     """Print the application header."""
@@ -26,8 +33,10 @@ def list_directories(base_path="."):
         list: List of directory paths
     """
     try:
-        dirs = [d for d in os.listdir(base_path) if os.path.isdir(os.path.join(base_path, d))]
-        return sorted(dirs)
+        # DirEntry.is_dir() uses the file type from the directory listing,
+        # so only symlinks need an extra stat
+        with os.scandir(base_path) as entries:
+            return sorted(entry.name for entry in entries if entry.is_dir())
     except Exception as e:
         print(f"Error listing directories: {str(e)}")
         return []
@@ -139,13 +148,16 @@ def create_slides_menu(create_presentation_func):
         
         print(f"\nSelected folder: {images_folder}")
     
-    # Check if there are images in the selected folder
-    image_extensions = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.bmp', '*.tiff']
-    image_files = []
-    
-    for extension in image_extensions:
-        image_files.extend(glob.glob(os.path.join(images_folder, extension)))
-        image_files.extend(glob.glob(os.path.join(images_folder, extension.upper())))
+    # Check if there are images in the selected folder (one directory pass)
+    try:
+        with os.scandir(images_folder) as entries:
+            image_files = [
+                entry.path for entry in entries
+                if entry.name.lower().endswith(IMAGE_EXTENSIONS) and entry.is_file()
+            ]
+    except OSError:
+        # Not a folder, or one that can't be read
+        image_files = []
     
     if not image_files:
         print(f"\nNo image files found in '{images_folder}'.")
@@ -186,20 +198,27 @@ def create_slides_menu(create_presentation_func):
     print("\nPresentation created successfully!")
     input("\nPress Enter to continue...")
 
-def convert_pdf_menu(convert_pdf_func):
+def convert_pdf_menu(convert_pdf_func, convert_many_func=None):
     """
     Display the convert to PDF menu and handle user input.
     
     Args:
         convert_pdf_func: Function to call for converting PPTX to PDF
+        convert_many_func: Optional function to call for converting several
+            PPTX files at once; enables the "convert all" option
     """
     clear_screen()
     print_header()
     print("CONVERT PRESENTATION TO PDF")
     print("-" * 60)
     
-    # List available PPTX files
-    pptx_files = [f for f in os.listdir(".") if f.endswith(".pptx")]
+    # List available PPTX files; the name check runs first so other entries
+    # are skipped without looking at their type
+    with os.scandir(".") as entries:
+        pptx_files = sorted(
+            entry.name for entry in entries
+            if entry.name.endswith(".pptx") and entry.is_file()
+        )
     
     if not pptx_files:
         print("No PowerPoint files found in the current directory.")
@@ -210,15 +229,21 @@ def convert_pdf_menu(convert_pdf_func):
     for i, file in enumerate(pptx_files, 1):
         print(f"{i}. {file}")
     
+    convert_all_available = convert_many_func is not None and len(pptx_files) > 1
+    if convert_all_available:
+        print("A. Convert all presentations")
+    
     # Get file selection
     try:
         selection = input("\nSelect presentation to convert [1]: ").strip() or "1"
-        idx = int(selection) - 1
-        if idx < 0 or idx >= len(pptx_files):
-            raise ValueError("Invalid selection")
-        
-        input_file = pptx_files[idx]
-        output_file = input_file.rsplit(".", 1)[0] + ".pdf"
+        convert_all = convert_all_available and selection.lower() == "a"
+        if not convert_all:
+            idx = int(selection) - 1
+            if idx < 0 or idx >= len(pptx_files):
+                raise ValueError("Invalid selection")
+            
+            input_file = pptx_files[idx]
+            output_file = input_file.rsplit(".", 1)[0] + ".pdf"
         
         # Get quality selection
         print("\nSelect PDF quality:")
@@ -235,10 +260,18 @@ def convert_pdf_menu(convert_pdf_func):
         quality = quality_map.get(quality_choice, "medium")
         
         # Call the conversion function
-        success = convert_pdf_func(input_file, output_file, quality)
-        
-        if not success:
-            print("\nConversion failed. Please check the error messages above.")
+        if convert_all:
+            results = convert_many_func(pptx_files, quality)
+            failed = [file for file, converted in results.items() if not converted]
+            print(f"\nConverted {len(results) - len(failed)} of {len(results)} presentations.")
+            if failed:
+                print("Conversion failed for: " + ", ".join(failed))
+                print("Please check the error messages above.")
+        else:
+            success = convert_pdf_func(input_file, output_file, quality)
+            
+            if not success:
+                print("\nConversion failed. Please check the error messages above.")
     
     except (ValueError, IndexError) as e:
         print(f"\nError: {str(e)}")